@@ -35,12 +35,21 @@ valid if the number modulo 97 is 1. As such it has two check digits.
 """
 
 from stdnum.exceptions import *
+from stdnum.util import isdigits
+
+
+# translation table of alphanumeric characters to their decimal value
+_base10_table = dict(
+    (ord(x), str(int(x, 36)))
+    for x in '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz')
 
 
 def _to_base10(number):
     """Prepare the number to its base10 representation."""
-    return ''.join(
-        str(int(x, 36)) for x in number)
+    number = number.translate(_base10_table)
+    if not isdigits(number):
+        raise InvalidFormat()
+    return number
 
 
 def checksum(number):
@@ -48,7 +48,7 @@ InvalidChecksum: ...
 import datetime
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_digits, weighted_sum
 
 
 def compact(number):
@@ -57,26 +57,28 @@ def compact(number):
     return clean(number, '-').strip()
 
 
+_weighted_digits = weighted_digits((2, 3, 4, 5, 6, 7, 8, 9, 2, 3, 4, 5))
+
+
 def calc_check_digit(number):
     """Calculate the check digit."""
-    weights = (2, 3, 4, 5, 6, 7, 8, 9, 2, 3, 4, 5)
-    check = sum(w * int(n) for w, n in zip(weights, number))
+    check = weighted_sum(_weighted_digits, number)
     return str((11 - (check % 11)) % 10)
 
 
+# the century of birth for each value of the seventh digit: 1, 2, 5 and 6
+# are born 1900-1999, 3, 4, 7 and 8 are born 2000-2099 and 0 and 9 are
+# born 1800-1899
+_centuries = (1800, 1900, 1900, 2000, 2000, 1900, 1900, 2000, 2000, 1800)
+
+
 def get_birth_date(number, allow_future=True):
     """Split the date parts from the number and return the birth date. If
     allow_future is False birth dates in the future are rejected."""
     number = compact(number)
-    year = int(number[0:2])
+    year = int(number[0:2]) + _centuries[int(number[6])]
     month = int(number[2:4])
     day = int(number[4:6])
-    if number[6] in '1256':  # born 1900-1999
-        year += 1900
-    elif number[6] in '3478':  # born 2000-2099
-        year += 2000
-    else:  # born 1800-1899
-        year += 1800
     try:
         date_of_birth = datetime.date(year, month, day)
     except ValueError:
@@ -38,7 +38,7 @@ InvalidChecksum: ...
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_digits, weighted_sum
 
 
 def compact(number):
@@ -50,12 +50,17 @@ def compact(number):
     return number
 
 
+# weights for the first and (if needed) second step of the check digit
+_weighted_digits1 = weighted_digits((1, 2, 3, 4, 5, 6, 7, 8, 9, 1, 2))
+_weighted_digits2 = weighted_digits((3, 4, 5, 6, 7, 8, 9, 1, 2, 3, 4))
+
+
 def calc_check_digit(number):
     """Calculate the check digit. The number passed should not have the
-    check digit included."""
-    check = sum((1 + i % 9) * int(n) for i, n in enumerate(number)) % 11
+    check digit included and should not be longer than 11 digits."""
+    check = weighted_sum(_weighted_digits1, number) % 11
     if check == 10:
-        check = sum((1 + (i + 2) % 9) * int(n) for i, n in enumerate(number))
+        check = weighted_sum(_weighted_digits2, number)
     return str(check % 11 % 10)
 
 
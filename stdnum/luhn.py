@@ -44,29 +44,54 @@ InvalidChecksum: ...
 14
 """
 
+from functools import lru_cache
+
 from stdnum.exceptions import *
 
 
+@lru_cache(maxsize=None)
+def _mk_luhn_tables(alphabet):
+    """Return mappings of characters to their value and to the digit sum of
+    their doubled value together with the modulus for the alphabet."""
+    n = len(alphabet)
+    return (
+        dict((c, i) for i, c in enumerate(alphabet)),
+        dict((c, (i * 2) // n + (i * 2) % n) for i, c in enumerate(alphabet)),
+        n)
+
+
+def _luhn_tables(alphabet):
+    """Return the (cached) tables for the alphabet."""
+    # the alphabet is used as cache key so should be hashable
+    if not isinstance(alphabet, str):
+        alphabet = tuple(alphabet)
+    return _mk_luhn_tables(alphabet)
+
+
+def _luhn_sum(number, last, second_last):
+    """Sum the values of the characters of the number, looking up the last
+    character and every second one before it in the last table and the
+    other characters in the second_last table."""
+    number = str(number)
+    try:
+        return (sum(map(last.__getitem__, number[-1::-2])) +
+                sum(map(second_last.__getitem__, number[-2::-2])))
+    except KeyError:
+        raise InvalidFormat()
+
+
 def checksum(number, alphabet='0123456789'):
     """Calculate the Luhn checksum over the provided number. The checksum
     is returned as an int. Valid numbers should have a checksum of 0."""
-    n = len(alphabet)
-    number = tuple(alphabet.index(i)
-                   for i in reversed(str(number)))
-    return (sum(number[::2]) +
-            sum(sum(divmod(i * 2, n))
-                for i in number[1::2])) % n
+    values, doubled, n = _luhn_tables(alphabet)
+    return _luhn_sum(number, values, doubled) % n
 
 
 def validate(number, alphabet='0123456789'):
     """Check if the number provided passes the Luhn checksum."""
     if not bool(number):
         raise InvalidFormat()
-    try:
-        valid = checksum(number, alphabet) == 0
-    except Exception:  # noqa: B902
-        raise InvalidFormat()
-    if not valid:
+    if checksum(number, alphabet) != 0:
         raise InvalidChecksum()
     return number
 
@@ -82,5 +107,8 @@ def is_valid(number, alphabet='0123456789'):
 def calc_check_digit(number, alphabet='0123456789'):
     """Calculate the extra digit that should be appended to the number to
     make it a valid number."""
-    ck = checksum(str(number) + alphabet[0], alphabet)
+    values, doubled, n = _luhn_tables(alphabet)
+    # the appended check digit shifts the positions of the digits by one so
+    # the digits that are doubled are the ones that are not in checksum()
+    ck = _luhn_sum(number, doubled, values) % n
     return alphabet[-ck]
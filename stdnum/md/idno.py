@@ -38,7 +38,7 @@ InvalidChecksum: ...
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_digits, weighted_sum
 
 
 def compact(number):
@@ -47,20 +47,22 @@ def compact(number):
     return clean(number, ' ').strip()
 
 
+_weighted_digits = weighted_digits((7, 3, 1, 7, 3, 1, 7, 3, 1, 7, 3, 1))
+
+
 def calc_check_digit(number):
     """Calculate the check digit."""
-    weights = (7, 3, 1, 7, 3, 1, 7, 3, 1, 7, 3, 1)
-    return str(sum(w * int(n) for w, n in zip(weights, number)) % 10)
+    return str(weighted_sum(_weighted_digits, number) % 10)
 
 
 def validate(number):
     """Check if the number provided is valid. This checks the length,
     formatting and check digit."""
     number = compact(number)
-    if not isdigits(number):
-        raise InvalidFormat()
     if len(number) != 13:
         raise InvalidLength()
+    if not isdigits(number):
+        raise InvalidFormat()
     if number[-1] != calc_check_digit(number):
         raise InvalidChecksum()
     return number
@@ -38,6 +38,7 @@ InvalidChecksum: ...
 '29360 87365 0070 3710 0'
 """
 
+from stdnum import imei, luhn
 from stdnum.exceptions import *
 from stdnum.util import clean, isdigits
 
@@ -52,10 +53,8 @@ def _cleanup(number):
 
 
 def _ishex(number):
-    for x in number:
-        if x not in _hex_alphabet:
-            return False
-    return True
+    # stripping all hex digits leaves an empty string for valid numbers
+    return not number.strip(_hex_alphabet)
 
 
 def _parse(number):
@@ -79,7 +78,6 @@ def calc_check_digit(number):
     already have a check digit."""
     # both the 18-digit decimal format and the 14-digit hex format
     # containing only decimal digits should use the decimal Luhn check
-    from stdnum import luhn
     if isdigits(number):
         return luhn.calc_check_digit(number)
     else:
@@ -111,7 +109,6 @@ def validate(number, strip_check_digit=True):
     to hexadecimal)."""
     # first parse the number
     number, cd = _parse(number)
-    from stdnum import luhn
     if len(number) == 18:
         # decimal format can be easily determined
         if cd:
@@ -125,7 +122,6 @@ def validate(number, strip_check_digit=True):
         cd = calc_check_digit(number)
     elif isdigits(number):
         # if the remaining hex format is fully decimal it is an IMEI number
-        from stdnum import imei
         imei.validate(number + cd)
     else:
         # normal hex Luhn validation
@@ -178,8 +174,7 @@ def format(number, separator=' ', format=None, add_check_digit=False):
 def to_binary(number):
     """Convert the number to its binary representation (without the check
     digit)."""
-    from binascii import a2b_hex
-    return a2b_hex(compact(number, strip_check_digit=True))
+    return bytes.fromhex(compact(number, strip_check_digit=True))
 
 
 def to_pseudo_esn(number):
@@ -44,7 +44,7 @@ InvalidChecksum: ...
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_digits, weighted_sum
 
 
 def compact(number):
@@ -61,10 +61,12 @@ def compact(number):
     return number
 
 
+_weighted_digits = weighted_digits((7, 6, 5, 4, 3, 2, 7, 6, 5, 4, 3, 2))
+
+
 def calc_check_digit(number):
     """Calculate the check digit."""
-    weights = (7, 6, 5, 4, 3, 2, 7, 6, 5, 4, 3, 2)
-    total = sum(int(n) * w for n, w in zip(number, weights))
+    total = weighted_sum(_weighted_digits, number)
     return str((-total % 11) % 10)
 
 
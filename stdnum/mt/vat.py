@@ -31,7 +31,7 @@ InvalidChecksum: ...
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_digits, weighted_sum
 
 
 def compact(number):
@@ -43,10 +43,12 @@ def compact(number):
     return number
 
 
+_weighted_digits = weighted_digits((3, 4, 6, 7, 8, 9, 10, 1))
+
+
 def checksum(number):
     """Calculate the checksum."""
-    weights = (3, 4, 6, 7, 8, 9, 10, 1)
-    return sum(w * int(n) for w, n in zip(weights, number)) % 37
+    return weighted_sum(_weighted_digits, number) % 37
 
 
 def validate(number):
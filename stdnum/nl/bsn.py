@@ -45,7 +45,7 @@ InvalidLength: ...
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_digits, weighted_sum
 
 
 def compact(number):
@@ -54,10 +54,13 @@ def compact(number):
     return clean(number, ' -.').strip().zfill(9)
 
 
+_weighted_digits = weighted_digits((9, 8, 7, 6, 5, 4, 3, 2))
+
+
 def checksum(number):
     """Calculate the checksum over the number. A valid number should have
-    a checksum of 0."""
-    return (sum((9 - i) * int(n) for i, n in enumerate(number[:-1])) -
+    a checksum of 0. The number should not be longer than 9 digits."""
+    return (weighted_sum(_weighted_digits, number[:-1]) -
             int(number[-1])) % 11
 
 
@@ -60,6 +60,10 @@ from stdnum.exceptions import *
 from stdnum.util import clean
 
 
+# Regular expression for matching the format of the number
+_identiteitskaartnummer_re = re.compile(r'^[A-Z]{2}[0-9A-Z]{6}[0-9]$')
+
+
 def compact(number):
     """Convert the number to the minimal representation. This strips the
     number of any valid separators and removes surrounding white space."""
@@ -72,10 +76,10 @@ def validate(number):
     number = compact(number)
     if len(number) != 9:
         raise InvalidLength()
-    if not re.match('^[A-Z]{2}[0-9A-Z]{6}[0-9]$', number):
+    if not _identiteitskaartnummer_re.match(number):
         raise InvalidFormat()
     if 'O' in number:
-        raise InvalidComponent(InvalidComponent("The letter 'O' is not allowed"))
+        raise InvalidComponent("The letter 'O' is not allowed")
     return number
 
 
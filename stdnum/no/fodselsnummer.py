@@ -45,7 +45,7 @@ InvalidChecksum: ...
 import datetime
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_digits, weighted_sum
 
 
 def compact(number):
@@ -54,16 +54,18 @@ def compact(number):
     return clean(number, ' -:')
 
 
+_weighted_digits1 = weighted_digits((3, 7, 6, 1, 8, 9, 4, 5, 2))
+_weighted_digits2 = weighted_digits((5, 4, 3, 2, 7, 6, 5, 4, 3, 2))
+
+
 def calc_check_digit1(number):
     """Calculate the first check digit for the number."""
-    weights = (3, 7, 6, 1, 8, 9, 4, 5, 2)
-    return str((11 - sum(w * int(n) for w, n in zip(weights, number))) % 11)
+    return str((11 - weighted_sum(_weighted_digits1, number)) % 11)
 
 
 def calc_check_digit2(number):
     """Calculate the second check digit for the number."""
-    weights = (5, 4, 3, 2, 7, 6, 5, 4, 3, 2)
-    return str((11 - sum(w * int(n) for w, n in zip(weights, number))) % 11)
+    return str((11 - weighted_sum(_weighted_digits2, number)) % 11)
 
 
 def get_gender(number):
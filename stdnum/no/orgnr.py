@@ -41,7 +41,7 @@ InvalidChecksum: ...
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_digits, weighted_sum
 
 
 def compact(number):
@@ -50,10 +50,12 @@ def compact(number):
     return clean(number, ' ').strip()
 
 
+_weighted_digits = weighted_digits((3, 2, 7, 6, 5, 4, 3, 2, 1))
+
+
 def checksum(number):
     """Calculate the checksum."""
-    weights = (3, 2, 7, 6, 5, 4, 3, 2, 1)
-    return sum(w * int(n) for w, n in zip(weights, number)) % 11
+    return weighted_sum(_weighted_digits, number) % 11
 
 
 def validate(number):
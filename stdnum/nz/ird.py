@@ -47,7 +47,7 @@ InvalidLength: ...
 """  # noqa: E501
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_digits, weighted_sum
 
 
 def compact(number):
@@ -58,19 +58,21 @@ def compact(number):
     return number
 
 
+_primary_weighted_digits = weighted_digits((3, 2, 7, 6, 5, 4, 3, 2))
+_secondary_weighted_digits = weighted_digits((7, 4, 3, 2, 5, 2, 7, 6))
+
+
 def calc_check_digit(number):
     """Calculate the check digit.
 
     The number passed should not have the check digit included.
     """
-    primary_weights = (3, 2, 7, 6, 5, 4, 3, 2)
-    secondary_weights = (7, 4, 3, 2, 5, 2, 7, 6)
     # pad with leading zeros
     number = number.zfill(8)
-    s = -sum(w * int(n) for w, n in zip(primary_weights, number)) % 11
+    s = -weighted_sum(_primary_weighted_digits, number) % 11
     if s != 10:
         return str(s)
-    s = -sum(w * int(n) for w, n in zip(secondary_weights, number)) % 11
+    s = -weighted_sum(_secondary_weighted_digits, number) % 11
     return str(s)
 
 
@@ -93,7 +93,7 @@ def validate(number):
         raise InvalidLength()
     if not get_gender(number):
         raise InvalidComponent()
-    if not get_province(number):
+    if number[0] not in PROVINCES:
         raise InvalidComponent()
     return number
 
@@ -33,7 +33,7 @@ InvalidChecksum: ...
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_digits, weighted_sum
 
 
 def compact(number):
@@ -45,10 +45,13 @@ def compact(number):
     return number
 
 
+# the check digit is subtracted
+_weighted_digits = weighted_digits((6, 5, 7, 2, 3, 4, 5, 6, 7, -1))
+
+
 def checksum(number):
     """Calculate the checksum."""
-    weights = (6, 5, 7, 2, 3, 4, 5, 6, 7, -1)
-    return sum(w * int(n) for w, n in zip(weights, number)) % 11
+    return weighted_sum(_weighted_digits, number) % 11
 
 
 def validate(number):
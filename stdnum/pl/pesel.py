@@ -50,7 +50,7 @@ datetime.date(2002, 1, 13)
 import datetime
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_digits, weighted_sum
 
 
 def compact(number):
@@ -88,11 +88,13 @@ def get_gender(number):
         return 'M'
 
 
+_weighted_digits = weighted_digits((1, 3, 7, 9, 1, 3, 7, 9, 1, 3))
+
+
 def calc_check_digit(number):
     """Calculate the check digit for organisations. The number passed
     should not have the check digit included."""
-    weights = (1, 3, 7, 9, 1, 3, 7, 9, 1, 3)
-    check = sum(w * int(n) for w, n in zip(weights, number))
+    check = weighted_sum(_weighted_digits, number)
     return str((10 - check) % 10)
 
 
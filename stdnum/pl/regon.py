@@ -51,7 +51,7 @@ InvalidChecksum: ...
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_digits, weighted_sum
 
 
 def compact(number):
@@ -60,14 +60,18 @@ def compact(number):
     return clean(number, ' -').upper().strip()
 
 
+_weighted_digits9 = weighted_digits((8, 9, 2, 3, 4, 5, 6, 7))
+_weighted_digits14 = weighted_digits((2, 4, 8, 5, 0, 9, 7, 3, 6, 1, 2, 4, 8))
+
+
 def calc_check_digit(number):
     """Calculate the check digit for organisations. The number passed
     should not have the check digit included."""
     if len(number) == 8:
-        weights = (8, 9, 2, 3, 4, 5, 6, 7)
+        tables = _weighted_digits9
     else:
-        weights = (2, 4, 8, 5, 0, 9, 7, 3, 6, 1, 2, 4, 8)
-    check = sum(w * int(n) for w, n in zip(weights, number))
+        tables = _weighted_digits14
+    check = weighted_sum(tables, number)
     return str(check % 11 % 10)
 
 
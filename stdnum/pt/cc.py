@@ -48,7 +48,7 @@ from stdnum.exceptions import *
 from stdnum.util import clean
 
 
-_cc_re = re.compile(r'^\d*[A-Z0-9]{2}\d$')
+_cc_re = re.compile(r'^[0-9]*[A-Z0-9]{2}[0-9]$')
 
 
 def compact(number):
@@ -58,13 +58,20 @@ def compact(number):
     return number
 
 
+# the values of the characters and of the (cut off) doubled characters
+_alphabet = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+_values = dict((n, i) for i, n in enumerate(_alphabet))
+_doubled = dict((n, i * 2 - 9 if i * 2 > 9 else i * 2) for i, n in enumerate(_alphabet))
+
+
 def calc_check_digit(number):
     """Calculate the check digit for the number."""
-    alphabet = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
-    cutoff = lambda x: x - 9 if x > 9 else x
-    s = sum(
-        cutoff(alphabet.index(n) * 2) if i % 2 == 0 else alphabet.index(n)
-        for i, n in enumerate(number[::-1]))
+    # starting from the right, every other character is doubled
+    try:
+        s = (sum(map(_doubled.__getitem__, number[-1::-2])) +
+             sum(map(_values.__getitem__, number[-2::-2])))
+    except KeyError:
+        raise InvalidFormat()
     return str((10 - s) % 10)
 
 
@@ -33,7 +33,7 @@ InvalidChecksum: ...
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_digits, weighted_sum
 
 
 def compact(number):
@@ -45,10 +45,13 @@ def compact(number):
     return number
 
 
+_weighted_digits = weighted_digits((9, 8, 7, 6, 5, 4, 3, 2))
+
+
 def calc_check_digit(number):
     """Calculate the check digit. The number passed should not have the
-    check digit included."""
-    s = sum((9 - i) * int(n) for i, n in enumerate(number))
+    check digit included and should not be longer than 8 digits."""
+    s = weighted_sum(_weighted_digits, number)
     return str((11 - s) % 11 % 10)
 
 
@@ -53,7 +53,7 @@ InvalidChecksum: ...
 import datetime
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_digits, weighted_sum
 
 
 # The Romanian counties
@@ -111,27 +111,33 @@ _COUNTIES = {
 }
 
 
+# The century of birth based on the first digit
+_CENTURIES = {
+    '1': 1900, '2': 1900, '3': 1800, '4': 1800, '5': 2000, '6': 2000,
+}
+
+
 def compact(number):
     """Convert the number to the minimal representation. This strips the
     number of any valid separators and removes surrounding whitespace."""
     return clean(number, ' -').strip()
 
 
+_weighted_digits = weighted_digits((2, 7, 9, 1, 4, 6, 3, 5, 8, 2, 7, 9))
+
+
 def calc_check_digit(number):
     """Calculate the check digit for personal codes."""
     # note that this algorithm has not been confirmed by an independent source
-    weights = (2, 7, 9, 1, 4, 6, 3, 5, 8, 2, 7, 9)
-    check = sum(w * int(n) for w, n in zip(weights, number)) % 11
+    check = weighted_sum(_weighted_digits, number) % 11
     return '1' if check == 10 else str(check)
 
 
 def get_birth_date(number):
     """Split the date parts from the number and return the birth date."""
     number = compact(number)
-    centuries = {
-        '1': 1900, '2': 1900, '3': 1800, '4': 1800, '5': 2000, '6': 2000,
-    }  # we assume 1900 for the others in order to try to construct a date
-    year = int(number[1:3]) + centuries.get(number[0], 1900)
+    # we assume 1900 for the others in order to try to construct a date
+    year = int(number[1:3]) + _CENTURIES.get(number[0], 1900)
     month = int(number[3:5])
     day = int(number[5:7])
     try:
@@ -44,7 +44,7 @@ InvalidChecksum: ...
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_digits, weighted_sum
 
 
 def compact(number):
@@ -56,11 +56,14 @@ def compact(number):
     return number
 
 
+_weighted_digits = weighted_digits((7, 5, 3, 2, 1, 7, 5, 3, 2))
+
+
 def calc_check_digit(number):
     """Calculate the check digit."""
-    weights = (7, 5, 3, 2, 1, 7, 5, 3, 2)
-    number = number.zfill(9)
-    check = 10 * sum(w * int(n) for w, n in zip(weights, number))
+    # align the weights to the right instead of padding the number with zeros
+    tables = _weighted_digits[max(0, 9 - len(number)):]
+    check = 10 * weighted_sum(tables, number)
     return str(check % 11 % 10)
 
 
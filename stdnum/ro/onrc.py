@@ -67,10 +67,7 @@ def compact(number):
     if number[2:3] == '/':
         number = number[:1] + '0' + number[1:]
     # convert trailing full date to year only
-    m = _onrc_fulldate_re.match(number)
-    if m:
-        number = ''.join(m.groups())
-    return number
+    return _onrc_fulldate_re.sub(r'\1\2', number)
 
 
 def validate(number):
@@ -87,7 +84,7 @@ def validate(number):
         raise InvalidComponent()
     if len(year) != 4:
         raise InvalidLength()
-    if int(year) < 1990 or int(year) > datetime.date.today().year:
+    if not 1990 <= int(year) <= datetime.date.today().year:
         raise InvalidComponent()
     return number
 
@@ -32,6 +32,7 @@ import ssl
 import sys
 import unicodedata
 import warnings
+from functools import lru_cache
 
 from stdnum.exceptions import *
 
@@ -40,10 +41,6 @@ from stdnum.exceptions import *
 _strip_doctest_re = re.compile(r'^>>> .*\Z', re.DOTALL | re.MULTILINE)
 
 
-# Regular expression to match digits
-_digits_re = re.compile(r'^[0-9]+$')
-
-
 def _mk_char_map(mapping):
     """Transform a dictionary with comma separated uniode character names
     to tuples with unicode characters as key."""
@@ -151,9 +148,14 @@ _char_map = dict(_mk_char_map({
 }))
 
 
-def _clean_chars(number):
-    """Replace various Unicode characters with their ASCII counterpart."""
-    return ''.join(_char_map.get(x, x) for x in number)
+@lru_cache(maxsize=None)
+def _clean_table(deletechars):
+    """Build a translation table that replaces various Unicode characters
+    with their ASCII counterpart and then removes the deletechars."""
+    table = dict((ord(x), None if y in deletechars else y)
+                 for x, y in _char_map.items())
+    table.update((ord(x), None) for x in deletechars if x not in _char_map)
+    return table
 
 
 def clean(number, deletechars=''):
@@ -165,18 +167,53 @@ def clean(number, deletechars=''):
     '1-2-3-4'
     """
     try:
-        number = ''.join(x for x in number)
+        number = ''.join(number)
     except Exception:  # noqa: B902
         raise InvalidFormat()
-    number = _clean_chars(number)
-    return ''.join(x for x in number if x not in deletechars)
+    return number.translate(_clean_table(deletechars))
 
 
 def isdigits(number):
-    """Check whether the provided string only consists of digits."""
+    """Check whether the provided string only consists of digits.
+
+    >>> isdigits('0123456789')
+    True
+    >>> isdigits('12\u0663')
+    False
+    >>> isdigits('123\\n')
+    False
+    >>> isdigits('')
+    False
+    """
     # This function is meant to replace str.isdigit() which will also return
     # True for all kind of unicode digits which is generally not what we want
-    return bool(_digits_re.match(number))
+    # (stripping all ASCII digits leaves an empty string for all-digit input)
+    return bool(number) and not number.strip('0123456789')
+
+
+def weighted_digits(weights):
+    """Build tables that map each digit to its weighted value for every
+    position. The result is meant to be passed to weighted_sum()."""
+    return tuple(dict((str(d), w * d) for d in range(10)) for w in weights)
+
+
+def weighted_sum(tables, number):
+    """Calculate the sum of the weighted digits of the number using the
+    tables from weighted_digits(). Digits beyond the last table are ignored
+    and InvalidFormat (a ValueError) is raised for anything that is not a
+    digit.
+
+    >>> weighted_sum(weighted_digits((3, 1, 3)), '987')
+    56
+    >>> weighted_sum(weighted_digits((3, 1, 3)), '9A7')
+    Traceback (most recent call last):
+        ...
+    InvalidFormat: ...
+    """
+    try:
+        return sum(map(dict.__getitem__, tables, number))
+    except KeyError:
+        raise InvalidFormat()
 
 
 def to_unicode(text):